@@ -4,6 +4,7 @@ from ._core import (
     CallVars,
     SigniaWarning,
     SignatureConflictError,
+    chain_kw,
     combine,
     fuse,
     merge_signatures,
@@ -15,6 +16,7 @@ __all__ = [
     "CallVars",
     "SigniaWarning",
     "SignatureConflictError",
+    "chain_kw",
     "combine",
     "fuse",
     "merge_signatures",
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from collections import ChainMap, OrderedDict
 from dataclasses import dataclass
-from functools import update_wrapper, wraps
+from functools import lru_cache, update_wrapper, wraps
+from operator import attrgetter
 import inspect
 from inspect import Parameter, Signature
-from types import MappingProxyType
+import sys
+from types import FunctionType, MappingProxyType
 from typing import Any, Callable, Mapping, Sequence
 import warnings
 
@@ -20,11 +22,36 @@ __all__ = [
     "mirror_signature",
     "same_signature",
     "fuse",
+    "chain_kw",
 ]
 
 
 _CACHE_MISS = object()
 
+# Sentinel for single-probe dict lookups (``get`` + identity test instead of
+# an ``in`` check followed by indexing).
+_MISSING = object()
+
+# ``Parameter.empty`` and ``Signature.empty`` are the same sentinel; binding it
+# once avoids a LOAD_ATTR on every check in the merging and comparison loops.
+_EMPTY = Parameter.empty
+
+# Parameter kinds bound once for the same reason; every identity test in the
+# routing and merging loops loads a module global instead of an enum member
+# attribute.
+_POS_ONLY = Parameter.POSITIONAL_ONLY
+_POS_OR_KW = Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POS = Parameter.VAR_POSITIONAL
+_KW_ONLY = Parameter.KEYWORD_ONLY
+_VAR_KW = Parameter.VAR_KEYWORD
+
+# Per-proxy bound on memoized override results; cleared wholesale when full.
+_OVERRIDE_CACHE_MAX = 32
+
+# C-level batch fetch of the four Parameter fields the key builders read,
+# replacing four LOAD_ATTR dispatches per parameter with one call.
+_PARAMETER_FIELDS = attrgetter("name", "kind", "default", "annotation")
+
 
 class _FusedSourceProxy:
     """Proxy exposing signature metadata for fused callables."""
@@ -32,27 +59,33 @@ class _FusedSourceProxy:
     __slots__ = (
         "_callable",
         "_signature",
+        "_bound",
         "_args",
         "_kwargs",
+        "_kw_view",
         "_defaults",
         "_cache",
         "_cache_vars",
+        "_override_cache",
         "_vars_targets",
     )
 
     def __init__(self, function: Callable[..., Any], /, *args: Any, **kwargs: Any) -> None:
         self._callable = function
-        self._signature = inspect.signature(function)
+        self._signature = _cached_signature(function)
         bound = self._signature.bind(*args, **kwargs)
-        self._args = bound.args
-        self._kwargs = dict(bound.kwargs)
-        self._defaults = {
-            name: parameter.default
-            for name, parameter in self._signature.parameters.items()
-            if parameter.default is not Parameter.empty
-        }
+        # The no-override call paths never mutate this binding, so it can be
+        # reused instead of re-binding the same captured arguments.
+        self._bound = bound
+        # ``*args`` is a fresh tuple and ``**kwargs`` a fresh dict owned by
+        # this call, so both can be stored without defensive copies.
+        self._args = args
+        self._kwargs = kwargs
+        self._kw_view: Mapping[str, Any] | None = None
+        self._defaults: dict[str, Any] | None = None
         self._cache: Any = _CACHE_MISS
         self._cache_vars: CallVars | None = None
+        self._override_cache: dict[tuple[Any, ...], tuple[Any, CallVars]] | None = None
         targets: list[Any] = [self._callable]
         function_target = getattr(function, "__func__", None)
         if function_target is not None and function_target is not function:
@@ -69,7 +102,22 @@ class _FusedSourceProxy:
     def kw(self) -> Mapping[str, Any]:
         """Return a read-only mapping of the original keyword arguments."""
 
-        return MappingProxyType(self._kwargs)
+        view = self._kw_view
+        if view is None:
+            view = self._kw_view = MappingProxyType(self._kwargs)
+        return view
+
+    # Mapping protocol over the captured keywords so ``**proxy`` expands
+    # without materializing an intermediate dict via ``.kw``.  ``__len__``
+    # is deliberately absent: it would make keyword-less proxies falsy.
+    def keys(self):
+        return self._kwargs.keys()
+
+    def __getitem__(self, name: str) -> Any:
+        return self._kwargs[name]
+
+    def __iter__(self):
+        return iter(self._kwargs)
 
     @property
     def signature(self) -> Signature:
@@ -87,7 +135,11 @@ class _FusedSourceProxy:
     def defaults(self) -> dict[str, Any]:
         """Return a mapping of parameter names to their default values."""
 
-        return dict(self._defaults)
+        defaults = self._defaults
+        if defaults is None:
+            defaults = _signature_defaults(self._signature)
+            self._defaults = defaults
+        return dict(defaults)
 
     def _bound_call(self) -> Any:
         """Invoke the stored callable using the captured binding."""
@@ -104,11 +156,13 @@ class _FusedSourceProxy:
     def _capture_call_vars(
         self, bound: inspect.BoundArguments, result: Any
     ) -> CallVars:
-        ordered = OrderedDict(bound.arguments.items())
+        # ``bound.kwargs`` already returns a fresh dict on each access and
+        # ``bound.arguments`` is owned by this binding, so neither needs a
+        # defensive copy beyond the OrderedDict wrap.
         snapshot = CallVars(
             args=bound.args,
-            kwargs=dict(bound.kwargs),
-            arguments=ordered,
+            kwargs=bound.kwargs,
+            arguments=OrderedDict(bound.arguments),
             result=result,
         )
         self._assign_call_vars(snapshot)
@@ -118,33 +172,48 @@ class _FusedSourceProxy:
         """Call the underlying function, optionally overriding arguments."""
 
         if not args and not kwargs:
-            if self._cache is _CACHE_MISS:
-                bound = self._signature.bind(*self._args, **self._kwargs)
-                result = self._callable(*bound.args, **bound.kwargs)
-                snapshot = self._capture_call_vars(bound, result)
-                self._cache = result
-                self._cache_vars = snapshot
+            # Hot path: one slot load and identity test decide hit vs miss.
+            result = self._cache
+            if result is not _CACHE_MISS:
+                snapshot = self._cache_vars
+                if snapshot is None:
+                    self._cache_vars = self._capture_call_vars(self._bound, result)
+                else:
+                    self._assign_call_vars(snapshot)
                 return result
 
-            if self._cache_vars is None:
-                bound = self._signature.bind(*self._args, **self._kwargs)
-                self._cache_vars = self._capture_call_vars(bound, self._cache)
+            bound = self._bound
+            result = self._callable(*bound.args, **bound.kwargs)
+            self._cache_vars = self._capture_call_vars(bound, result)
+            self._cache = result
+            return result
 
-            snapshot = self._cache_vars
-            self._assign_call_vars(snapshot)
-            return self._cache
+        override_key: tuple[Any, ...] | None
+        try:
+            override_key = (args, frozenset(kwargs.items()))
+            hash(override_key)
+        except TypeError:
+            override_key = None
+
+        if override_key is not None:
+            cache = self._override_cache
+            if cache is not None:
+                hit = cache.get(override_key)
+                if hit is not None:
+                    result, snapshot = hit
+                    self._assign_call_vars(snapshot)
+                    return result
 
         bound = self._signature.bind(*self._args, **self._kwargs)
-        if args or kwargs:
-            overrides = self._signature.bind_partial(*args, **kwargs)
-            for name, value in overrides.arguments.items():
-                bound.arguments[name] = value
+        overrides = self._signature.bind_partial(*args, **kwargs)
+        for name, value in overrides.arguments.items():
+            bound.arguments[name] = value
 
         missing: list[str] = []
         for name, parameter in self._signature.parameters.items():
-            if parameter.default is not Parameter.empty:
+            if parameter.default is not _EMPTY:
                 continue
-            if parameter.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            if parameter.kind in (_VAR_POS, _VAR_KW):
                 continue
             if name not in bound.arguments:
                 missing.append(name)
@@ -158,7 +227,14 @@ class _FusedSourceProxy:
             )
 
         result = self._callable(*bound.args, **bound.kwargs)
-        self._capture_call_vars(bound, result)
+        snapshot = self._capture_call_vars(bound, result)
+        if override_key is not None:
+            cache = self._override_cache
+            if cache is None:
+                cache = self._override_cache = {}
+            elif len(cache) >= _OVERRIDE_CACHE_MAX:
+                cache.clear()
+            cache[override_key] = (result, snapshot)
         return result
 
     def __repr__(self) -> str:
@@ -166,11 +242,11 @@ class _FusedSourceProxy:
 
 
 _PARAMETER_KIND_ORDER = (
-    Parameter.POSITIONAL_ONLY,
-    Parameter.POSITIONAL_OR_KEYWORD,
-    Parameter.VAR_POSITIONAL,
-    Parameter.KEYWORD_ONLY,
-    Parameter.VAR_KEYWORD,
+    _POS_ONLY,
+    _POS_OR_KW,
+    _VAR_POS,
+    _KW_ONLY,
+    _VAR_KW,
 )
 
 
@@ -246,11 +322,12 @@ def _merge_fuse_signatures(
 
     for index, signature in enumerate(signatures):
         for parameter in signature.parameters.values():
-            occurrences = occurrence_sources.setdefault(parameter.name, [])
+            name = sys.intern(parameter.name)
+            occurrences = occurrence_sources.setdefault(name, [])
             occurrence_index = len(occurrences)
             occurrences.append(index)
-            parameter_lookup[id(parameter)] = (parameter.name, occurrence_index)
-            source_parameter_lookup[(index, parameter.name)] = parameter
+            parameter_lookup[id(parameter)] = (name, occurrence_index)
+            source_parameter_lookup[(index, name)] = parameter
 
     def _source_name(index: int) -> str:
         try:
@@ -277,6 +354,23 @@ def _merge_fuse_signatures(
             return indices[-1] if policy == "prefer-last" else indices[0]
         return indices[occurrence_index]
 
+    def _raise_metadata_mismatch(
+        label: str, name: str, incoming: Parameter, policy: str
+    ) -> None:
+        # All lookups and formatting live here, on the raise path only; the
+        # resolvers stay allocation-free when no matching conflict fires.
+        incoming_info = parameter_lookup.get(id(incoming))
+        occurrence_index = incoming_info[1] if incoming_info is not None else None
+        owner_index = _owner_index(name, occurrence_index, policy)
+        incoming_index = _incoming_index(name, occurrence_index, policy)
+        owner_value = getattr(_lookup_parameter(owner_index, name), label)
+        incoming_value = getattr(_lookup_parameter(incoming_index, name), label)
+        raise SignatureConflictError(
+            f"{label} mismatch for parameter '{name}': "
+            f"{_source_name(owner_index)}={owner_value!r}, "
+            f"{_source_name(incoming_index)}={incoming_value!r}"
+        )
+
     policy: str
     resolver: ConflictResolver | None
 
@@ -284,14 +378,17 @@ def _merge_fuse_signatures(
         on_conflict = "error"
 
     if on_conflict == "error":
-        duplicates = [
-            (name, [source_names[index] for index in indices])
-            for name, indices in occurrence_sources.items()
-            if len(indices) > 1
-        ]
-        if duplicates:
-            name, owners = duplicates[0]
-            owners_display = ", ".join(owners)
+        duplicate = next(
+            (
+                (name, indices)
+                for name, indices in occurrence_sources.items()
+                if len(indices) > 1
+            ),
+            None,
+        )
+        if duplicate is not None:
+            name, indices = duplicate
+            owners_display = ", ".join(source_names[index] for index in indices)
             raise SignatureConflictError(
                 f"parameter name collision for '{name}': {owners_display}"
             )
@@ -301,30 +398,11 @@ def _merge_fuse_signatures(
         policy = "prefer-first"
 
         def resolver(name: str, existing: Parameter, incoming: Parameter, conflicts: tuple[ConflictDetail, ...]) -> Parameter:
-            incoming_info = parameter_lookup.get(id(incoming))
-            occurrence_index = incoming_info[1] if incoming_info is not None else None
-            owner_index = _owner_index(name, occurrence_index, policy)
-            incoming_index = _incoming_index(name, occurrence_index, policy)
-            owner_name = _source_name(owner_index)
-            incoming_name = _source_name(incoming_index)
-
             for conflict_type, _, _ in conflicts:
                 if conflict_type == "default" and compare_defaults:
-                    owner_parameter = _lookup_parameter(owner_index, name)
-                    incoming_parameter = _lookup_parameter(incoming_index, name)
-                    raise SignatureConflictError(
-                        f"default mismatch for parameter '{name}': "
-                        f"{owner_name}={owner_parameter.default!r}, "
-                        f"{incoming_name}={incoming_parameter.default!r}"
-                    )
+                    _raise_metadata_mismatch("default", name, incoming, policy)
                 if conflict_type == "annotation" and compare_annotations:
-                    owner_parameter = _lookup_parameter(owner_index, name)
-                    incoming_parameter = _lookup_parameter(incoming_index, name)
-                    raise SignatureConflictError(
-                        f"annotation mismatch for parameter '{name}': "
-                        f"{owner_name}={owner_parameter.annotation!r}, "
-                        f"{incoming_name}={incoming_parameter.annotation!r}"
-                    )
+                    _raise_metadata_mismatch("annotation", name, incoming, policy)
 
             return existing
 
@@ -332,30 +410,11 @@ def _merge_fuse_signatures(
         policy = "prefer-last"
 
         def resolver(name: str, existing: Parameter, incoming: Parameter, conflicts: tuple[ConflictDetail, ...]) -> Parameter:
-            incoming_info = parameter_lookup.get(id(incoming))
-            occurrence_index = incoming_info[1] if incoming_info is not None else None
-            owner_index = _owner_index(name, occurrence_index, policy)
-            incoming_index = _incoming_index(name, occurrence_index, policy)
-            owner_name = _source_name(owner_index)
-            incoming_name = _source_name(incoming_index)
-
             for conflict_type, _, _ in conflicts:
                 if conflict_type == "default" and compare_defaults:
-                    owner_parameter = _lookup_parameter(owner_index, name)
-                    incoming_parameter = _lookup_parameter(incoming_index, name)
-                    raise SignatureConflictError(
-                        f"default mismatch for parameter '{name}': "
-                        f"{owner_name}={owner_parameter.default!r}, "
-                        f"{incoming_name}={incoming_parameter.default!r}"
-                    )
+                    _raise_metadata_mismatch("default", name, incoming, policy)
                 if conflict_type == "annotation" and compare_annotations:
-                    owner_parameter = _lookup_parameter(owner_index, name)
-                    incoming_parameter = _lookup_parameter(incoming_index, name)
-                    raise SignatureConflictError(
-                        f"annotation mismatch for parameter '{name}': "
-                        f"{owner_name}={owner_parameter.annotation!r}, "
-                        f"{incoming_name}={incoming_parameter.annotation!r}"
-                    )
+                    _raise_metadata_mismatch("annotation", name, incoming, policy)
 
             return incoming
 
@@ -380,9 +439,9 @@ def _merge_fuse_signatures(
     has_varkw = False
 
     for parameter in merged_signature.parameters.values():
-        if parameter.kind is Parameter.VAR_POSITIONAL:
+        if parameter.kind is _VAR_POS:
             has_varargs = True
-        elif parameter.kind is Parameter.VAR_KEYWORD:
+        elif parameter.kind is _VAR_KW:
             has_varkw = True
 
         indices = occurrence_sources.get(parameter.name)
@@ -416,7 +475,10 @@ class _FusedSourceMetadata:
     has_varkw: bool
 
 
-_VALID_PUBLISH_MODES = {"auto", "function", "method", "classmethod", "staticmethod"}
+_VALID_PUBLISH_MODES = frozenset(
+    {"auto", "function", "method", "classmethod", "staticmethod"}
+)
+_VALID_ON_CONFLICT_MODES = frozenset({"error", "left", "right", None})
 
 
 def _detect_publish_mode(
@@ -431,8 +493,8 @@ def _detect_publish_mode(
         first_positional: Parameter | None = None
         for parameter in signature.parameters.values():
             if parameter.kind in (
-                Parameter.POSITIONAL_ONLY,
-                Parameter.POSITIONAL_OR_KEYWORD,
+                _POS_ONLY,
+                _POS_OR_KW,
             ):
                 first_positional = parameter
                 break
@@ -465,6 +527,18 @@ def _detect_publish_mode(
     return mode, context_parameter
 
 
+# Merge results for repeated fuse() decorations over the same sources.
+# Signatures are shared through _cached_signature, so id-based keys hit for
+# re-decorations; values keep strong references to keep the ids valid, and
+# the cache is cleared once full to bound memory.  (Signature declares
+# __slots__ without __weakref__, so weakref-based eviction is not an option.)
+_FUSE_MERGE_CACHE: dict[
+    tuple[Any, ...],
+    tuple[tuple[Signature, ...], tuple[Signature, dict[str, int], bool, bool]],
+] = {}
+_FUSE_MERGE_CACHE_MAX = 256
+
+
 def fuse(
     *sources: Callable[..., Any],
     publish: str = "auto",
@@ -484,7 +558,7 @@ def fuse(
 
     if not (
         callable(on_conflict)
-        or on_conflict in {"error", "left", "right", None}
+        or on_conflict in _VALID_ON_CONFLICT_MODES
     ):
         raise ValueError(
             "on_conflict must be 'error', 'left', 'right', a callable, or None"
@@ -495,7 +569,7 @@ def fuse(
         if not callable(source):
             raise TypeError("fuse sources must be callable")
 
-        signature = inspect.signature(source)
+        signature = _cached_signature(source)
         is_bound = inspect.ismethod(source) and getattr(source, "__self__", None) is not None
         if is_bound:
             warnings.warn(
@@ -504,36 +578,50 @@ def fuse(
                 stacklevel=2,
             )
 
+        _, kinds = _signature_soa(signature)
         metadata.append(
             _FusedSourceMetadata(
                 function=source,
                 signature=signature,
                 name=_describe_source(source),
                 is_bound_method=is_bound,
-                has_varargs=any(
-                    parameter.kind is Parameter.VAR_POSITIONAL
-                    for parameter in signature.parameters.values()
-                ),
-                has_varkw=any(
-                    parameter.kind is Parameter.VAR_KEYWORD
-                    for parameter in signature.parameters.values()
-                ),
+                has_varargs=_VAR_POS in kinds,
+                has_varkw=_VAR_KW in kinds,
             )
         )
 
-    merged_signature, _, _, _ = _merge_fuse_signatures(
-        [item.signature for item in metadata],
-        on_conflict=on_conflict,
-        compare_defaults=compare_defaults,
-        compare_annotations=compare_annotations,
-    )
+    source_signatures = tuple(item.signature for item in metadata)
+    cache_key: tuple[Any, ...] | None = None
+    if not callable(on_conflict):
+        cache_key = (
+            tuple(map(id, source_signatures)),
+            on_conflict,
+            compare_defaults,
+            compare_annotations,
+        )
+
+    cached = _FUSE_MERGE_CACHE.get(cache_key) if cache_key is not None else None
+    if cached is not None and all(
+        cached_signature is signature
+        for cached_signature, signature in zip(cached[0], source_signatures)
+    ):
+        merged_signature = cached[1][0]
+    else:
+        merged = _merge_fuse_signatures(
+            source_signatures,
+            on_conflict=on_conflict,
+            compare_defaults=compare_defaults,
+            compare_annotations=compare_annotations,
+        )
+        merged_signature = merged[0]
+        if cache_key is not None:
+            if len(_FUSE_MERGE_CACHE) >= _FUSE_MERGE_CACHE_MAX:
+                _FUSE_MERGE_CACHE.clear()
+            _FUSE_MERGE_CACHE[cache_key] = (source_signatures, merged)
 
+    _, merged_kinds = _signature_soa(merged_signature)
     vararg_sources = sum(1 for item in metadata if item.has_varargs)
-    merged_vararg_count = sum(
-        1
-        for parameter in merged_signature.parameters.values()
-        if parameter.kind is Parameter.VAR_POSITIONAL
-    )
+    merged_vararg_count = merged_kinds.count(_VAR_POS)
     if vararg_sources > 1 and merged_vararg_count < vararg_sources:
         warnings.warn(
             "multiple sources supplied *args parameters; merged signature collapses them",
@@ -542,11 +630,7 @@ def fuse(
         )
 
     varkw_sources = sum(1 for item in metadata if item.has_varkw)
-    merged_varkw_count = sum(
-        1
-        for parameter in merged_signature.parameters.values()
-        if parameter.kind is Parameter.VAR_KEYWORD
-    )
+    merged_varkw_count = merged_kinds.count(_VAR_KW)
     if varkw_sources > 1 and merged_varkw_count < varkw_sources:
         warnings.warn(
             "multiple sources supplied **kwargs parameters; merged signature collapses them",
@@ -574,15 +658,15 @@ def fuse(
         remaining_sources = len(metadata)
         for parameter in wrapper_parameters[start_index:]:
             if parameter.kind in (
-                Parameter.POSITIONAL_ONLY,
-                Parameter.POSITIONAL_OR_KEYWORD,
+                _POS_ONLY,
+                _POS_OR_KW,
             ):
                 positional_capacity += 1
                 if remaining_sources > 0:
                     proxy_parameters_end += 1
                     remaining_sources -= 1
                 continue
-            if parameter.kind is Parameter.VAR_POSITIONAL:
+            if parameter.kind is _VAR_POS:
                 vararg_available = True
                 if remaining_sources > 0:
                     proxy_parameters_end += 1
@@ -600,16 +684,16 @@ def fuse(
             if not public_parameters or public_parameters[0].name != context_parameter:
                 context = Parameter(
                     context_parameter,
-                    kind=Parameter.POSITIONAL_OR_KEYWORD,
+                    kind=_POS_OR_KW,
                 )
                 public_parameters.insert(0, context)
 
         existing_names = {parameter.name for parameter in public_parameters}
         has_var_positional = any(
-            parameter.kind is Parameter.VAR_POSITIONAL for parameter in public_parameters
+            parameter.kind is _VAR_POS for parameter in public_parameters
         )
         has_var_keyword = any(
-            parameter.kind is Parameter.VAR_KEYWORD for parameter in public_parameters
+            parameter.kind is _VAR_KW for parameter in public_parameters
         )
 
         wrapper_only_parameters: list[Parameter] = []
@@ -626,15 +710,15 @@ def fuse(
         for parameter in wrapper_parameters[proxy_parameters_end:]:
             if parameter.name in existing_names:
                 continue
-            if parameter.kind is Parameter.VAR_POSITIONAL and has_var_positional:
+            if parameter.kind is _VAR_POS and has_var_positional:
                 continue
-            if parameter.kind is Parameter.VAR_KEYWORD and has_var_keyword:
+            if parameter.kind is _VAR_KW and has_var_keyword:
                 continue
             insert_parameter(public_parameters, parameter)
             existing_names.add(parameter.name)
-            if parameter.kind is Parameter.VAR_POSITIONAL:
+            if parameter.kind is _VAR_POS:
                 has_var_positional = True
-            if parameter.kind is Parameter.VAR_KEYWORD:
+            if parameter.kind is _VAR_KW:
                 has_var_keyword = True
             wrapper_only_parameters.append(parameter)
 
@@ -664,84 +748,87 @@ def fuse(
                 stacklevel=2,
             )
 
+        # Kind-grouped name tuples per source, computed once instead of
+        # walking parameter objects and branching on kind for every call.
+        source_plans = [_build_dispatch_plan(item.signature) for item in metadata]
+
+        # CPython-native binding for the public signature, mirroring the
+        # combine dispatcher: the binder's def line is the rendered merged
+        # signature, so binding and default application happen without
+        # Signature.bind on the call path.
+        binder = _compile_binder(
+            public_signature, getattr(wrapper, "__name__", "fused")
+        )
+        public_names = tuple(public_signature.parameters)
+
         def build_proxy(
             index: int,
             arguments: Mapping[str, Any],
-            origins: Mapping[str, str],
+            keyword_names: Mapping[str, Any],
         ) -> _FusedSourceProxy:
-            info = metadata[index]
+            plan = source_plans[index]
             args: list[Any] = []
             kwargs: dict[str, Any] = {}
-            for parameter in info.signature.parameters.values():
-                name = parameter.name
-                if parameter.kind is Parameter.POSITIONAL_ONLY:
-                    args.append(arguments[name])
-                elif parameter.kind is Parameter.POSITIONAL_OR_KEYWORD:
-                    origin = origins.get(name)
-                    if origin == "keyword":
-                        kwargs[name] = arguments[name]
-                    else:
-                        args.append(arguments[name])
-                elif parameter.kind is Parameter.VAR_POSITIONAL:
-                    args.extend(arguments.get(name, ()))
-                elif parameter.kind is Parameter.KEYWORD_ONLY:
+            for name in plan.positional_only:
+                args.append(arguments[name])
+            for name in plan.positional_or_keyword:
+                if name in keyword_names:
                     kwargs[name] = arguments[name]
-                elif parameter.kind is Parameter.VAR_KEYWORD:
-                    kwargs.update(arguments.get(name, {}))
-            return _FusedSourceProxy(info.function, *args, **kwargs)
+                else:
+                    args.append(arguments[name])
+            if plan.var_positional is not None:
+                args.extend(arguments.get(plan.var_positional, ()))
+            for name in plan.keyword_only:
+                kwargs[name] = arguments[name]
+            if plan.var_keyword is not None:
+                kwargs.update(arguments.get(plan.var_keyword, {}))
+            return _FusedSourceProxy(metadata[index].function, *args, **kwargs)
 
         def fused(*call_args: Any, **call_kwargs: Any) -> Any:
-            bound = public_signature.bind(*call_args, **call_kwargs)
-            provided_arguments = OrderedDict(bound.arguments)
-            bound.apply_defaults()
-            arguments = OrderedDict(bound.arguments)
+            if binder is not None:
+                arguments = OrderedDict(
+                    zip(public_names, binder(*call_args, **call_kwargs))
+                )
+            else:
+                bound = public_signature.bind(*call_args, **call_kwargs)
+                bound.apply_defaults()
+                arguments = OrderedDict(bound.arguments)
 
             wrapper_positional_args: list[Any] = []
             wrapper_keyword_args: dict[str, Any] = {}
 
             for parameter in wrapper_only_parameters:
                 name = parameter.name
-                if parameter.kind is Parameter.POSITIONAL_ONLY:
+                if parameter.kind is _POS_ONLY:
                     value = arguments.pop(name)
                     wrapper_positional_args.append(value)
-                elif parameter.kind is Parameter.POSITIONAL_OR_KEYWORD:
+                elif parameter.kind is _POS_OR_KW:
                     value = arguments.pop(name)
                     wrapper_positional_args.append(value)
-                elif parameter.kind is Parameter.VAR_POSITIONAL:
+                elif parameter.kind is _VAR_POS:
                     value = arguments.pop(name, ())
                     wrapper_positional_args.extend(value)
-                elif parameter.kind is Parameter.KEYWORD_ONLY:
+                elif parameter.kind is _KW_ONLY:
                     value = arguments.pop(name)
                     wrapper_keyword_args[name] = value
-                elif parameter.kind is Parameter.VAR_KEYWORD:
+                elif parameter.kind is _VAR_KW:
                     value = arguments.pop(name, {})
                     wrapper_keyword_args.update(value)
-                provided_arguments.pop(name, None)
-
-            origins: dict[str, str] = {}
-            for name in arguments:
-                if name in provided_arguments:
-                    if name in call_kwargs:
-                        origins[name] = "keyword"
-                    else:
-                        origins[name] = "positional"
-                else:
-                    origins[name] = "default"
 
             proxy_cache: dict[int, _FusedSourceProxy] = {}
 
             def get_proxy(index: int) -> _FusedSourceProxy:
                 proxy = proxy_cache.get(index)
                 if proxy is None:
-                    proxy = build_proxy(index, arguments, origins)
+                    # Only keyword origin changes routing; membership in the
+                    # caller's kwargs is the whole signal.
+                    proxy = build_proxy(index, arguments, call_kwargs)
 
-                    info = metadata[index]
-                    bound = info.signature.bind(*proxy.args, **dict(proxy.kw))
-                    ordered = OrderedDict(bound.arguments.items())
+                    bound = proxy._bound
                     snapshot = CallVars(
                         args=bound.args,
-                        kwargs=dict(bound.kwargs),
-                        arguments=ordered,
+                        kwargs=bound.kwargs,
+                        arguments=OrderedDict(bound.arguments),
                         result=_CACHE_MISS,
                     )
                     proxy._cache_vars = snapshot
@@ -775,6 +862,29 @@ def fuse(
     return decorator
 
 
+def chain_kw(*proxies: _FusedSourceProxy | Mapping[str, Any]) -> ChainMap:
+    """Compose keyword captures from *proxies* into a single view.
+
+    The returned :class:`collections.ChainMap` layers the proxies' captured
+    keyword arguments without copying them, so ``call(**chain_kw(a, b))``
+    expands every section in one pass instead of materialising intermediate
+    dicts per proxy.  Earlier proxies take precedence for duplicated names.
+    Plain mappings may be mixed in alongside proxies.  Proxies contribute
+    their read-only views, so writing through the chain raises
+    :class:`TypeError` instead of mutating a proxy's captured arguments.
+    """
+
+    if not proxies:
+        raise ValueError("chain_kw requires at least one proxy or mapping")
+
+    return ChainMap(
+        *(
+            proxy.kw if isinstance(proxy, _FusedSourceProxy) else proxy
+            for proxy in proxies
+        )
+    )
+
+
 def mirror_signature(src: Callable[..., Any]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Mirror a callable's signature and metadata onto another.
 
@@ -790,13 +900,18 @@ def mirror_signature(src: Callable[..., Any]) -> Callable[[Callable[..., Any]],
     "(name: str, excited: bool = False) -> str"
     """
 
-    signature = inspect.signature(src)
+    signature = _cached_signature(src)
 
     def decorator(target: Callable[..., Any]) -> Callable[..., Any]:
-        update_wrapper(target, src)
-        target.__wrapped__ = src
-        target.__doc__ = src.__doc__
+        for attribute in ("__module__", "__qualname__", "__annotations__"):
+            try:
+                setattr(target, attribute, getattr(src, attribute))
+            except AttributeError:
+                pass
+        target.__dict__.update(getattr(src, "__dict__", {}))
         target.__name__ = src.__name__
+        target.__doc__ = src.__doc__
+        target.__wrapped__ = src
         target.__signature__ = signature
         return target
 
@@ -866,6 +981,46 @@ def same_signature(
     True
     """
 
+    if first is second:
+        return True
+
+    if (
+        type(first) is FunctionType
+        and type(second) is FunctionType
+        and "__signature__" not in first.__dict__
+        and "__signature__" not in second.__dict__
+        and "__wrapped__" not in first.__dict__
+        and "__wrapped__" not in second.__dict__
+    ):
+        if (
+            first.__code__ is second.__code__
+            and first.__defaults__ == second.__defaults__
+            and first.__kwdefaults__ == second.__kwdefaults__
+            and (ignore_annotations or first.__annotations__ == second.__annotations__)
+        ):
+            # Function clones sharing one code object have identical parameter
+            # names and kinds; matching defaults and annotations make the
+            # signatures equal without materialising either one.
+            return True
+        if _code_arity(first.__code__) != _code_arity(second.__code__):
+            return False
+
+    if (
+        strict
+        and not isinstance(first, Signature)
+        and not isinstance(second, Signature)
+    ):
+        with_annotations = not ignore_annotations
+        with_return = with_annotations and not ignore_return
+        key_a = _signature_key(
+            first, with_annotations=with_annotations, with_return=with_return
+        )
+        key_b = _signature_key(
+            second, with_annotations=with_annotations, with_return=with_return
+        )
+        if key_a is not None and key_b is not None:
+            return key_a == key_b
+
     signature_a = _ensure_signature(first)
     signature_b = _ensure_signature(second)
 
@@ -874,8 +1029,10 @@ def same_signature(
         signature_b = _strip_parameter_annotations(signature_b)
 
     if ignore_return or ignore_annotations:
-        signature_a = signature_a.replace(return_annotation=Signature.empty)
-        signature_b = signature_b.replace(return_annotation=Signature.empty)
+        if signature_a.return_annotation is not _EMPTY:
+            signature_a = signature_a.replace(return_annotation=_EMPTY)
+        if signature_b.return_annotation is not _EMPTY:
+            signature_b = signature_b.replace(return_annotation=_EMPTY)
 
     if strict:
         return signature_a == signature_b
@@ -883,38 +1040,281 @@ def same_signature(
     return _compatible_signatures(signature_a, signature_b)
 
 
+def _code_arity(code: Any) -> int:
+    """Return the number of parameters described by a code object."""
+
+    return (
+        code.co_argcount
+        + code.co_kwonlyargcount
+        + bool(code.co_flags & inspect.CO_VARARGS)
+        + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _signature_from_cache(target: Callable[..., Any]) -> Signature:
+    return inspect.signature(target)
+
+
+def _cached_signature(target: Callable[..., Any]) -> Signature:
+    """Return :func:`inspect.signature` for *target*, memoising when hashable."""
+
+    # Functions wrapped by this module (mirror_signature, combine) carry a
+    # ready-made __signature__; returning it directly skips the whole
+    # inspect.signature resolution machinery.  Restricted to plain functions
+    # because bound methods forward attribute access to __func__ without
+    # stripping the instance parameter.
+    if type(target) is FunctionType:
+        signature = target.__dict__.get("__signature__")
+        if isinstance(signature, Signature):
+            return signature
+
+    try:
+        return _signature_from_cache(target)
+    except TypeError:
+        return inspect.signature(target)
+
+
+@lru_cache(maxsize=1024)
+def _signature_soa_from_cache(
+    signature: Signature,
+) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+    names: list[str] = []
+    kinds: list[Any] = []
+    for parameter in signature.parameters.values():
+        # Names from ``def`` statements are interned by the compiler already;
+        # interning here extends the pointer-equality dict fast path to
+        # signatures assembled programmatically.
+        names.append(sys.intern(parameter.name))
+        kinds.append(parameter.kind)
+    return tuple(names), tuple(kinds)
+
+
+def _signature_soa(signature: Signature) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+    """Return parallel ``(names, kinds)`` tuples for *signature*'s parameters.
+
+    The flat tuples replace repeated attribute chasing over ``Parameter``
+    objects in walks that only need names or kinds, and are shared across
+    callers when the signature is hashable.
+    """
+
+    try:
+        return _signature_soa_from_cache(signature)
+    except TypeError:
+        parameters = signature.parameters.values()
+        return (
+            tuple(parameter.name for parameter in parameters),
+            tuple(parameter.kind for parameter in parameters),
+        )
+
+
+@lru_cache(maxsize=1024)
+def _signature_defaults_from_cache(signature: Signature) -> dict[str, Any]:
+    return {
+        name: parameter.default
+        for name, parameter in signature.parameters.items()
+        if parameter.default is not _EMPTY
+    }
+
+
+def _signature_defaults(signature: Signature) -> dict[str, Any]:
+    """Return the default-value mapping for *signature*, shared when hashable.
+
+    Proxies expose defaults through a copying accessor, so one mapping can
+    back every proxy built over the same signature.
+    """
+
+    try:
+        return _signature_defaults_from_cache(signature)
+    except TypeError:
+        return {
+            name: parameter.default
+            for name, parameter in signature.parameters.items()
+            if parameter.default is not _EMPTY
+        }
+
+
+@lru_cache(maxsize=1024)
+def _signature_key_from_cache(
+    target: Callable[..., Any],
+    with_annotations: bool = True,
+    with_return: bool = True,
+):
+    signature = _cached_signature(target)
+    ordered: list[tuple[Any, ...]] = []
+    keyword_only: list[tuple[Any, ...]] = []
+    for parameter in signature.parameters.values():
+        name, kind, default, annotation = _PARAMETER_FIELDS(parameter)
+        if not with_annotations:
+            annotation = _EMPTY
+        entry = (name, kind, default, annotation)
+        if kind is _KW_ONLY:
+            keyword_only.append(entry)
+        else:
+            ordered.append(entry)
+
+    try:
+        keyword_key = frozenset(keyword_only)
+    except TypeError:
+        return None
+
+    return_annotation = signature.return_annotation if with_return else _EMPTY
+    return (tuple(ordered), keyword_key, return_annotation)
+
+
+def _signature_key(
+    target: Callable[..., Any],
+    *,
+    with_annotations: bool = True,
+    with_return: bool = True,
+):
+    """Return a comparison key mirroring :meth:`Signature.__eq__` semantics.
+
+    ``None`` is returned when the callable or its defaults are unhashable and
+    the key cannot be cached or compared cheaply.
+    """
+
+    try:
+        return _signature_key_from_cache(target, with_annotations, with_return)
+    except TypeError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _ordered_signature_key_from_cache(target: Callable[..., Any]):
+    signature = _cached_signature(target)
+    key = (
+        tuple(
+            _PARAMETER_FIELDS(parameter)
+            for parameter in signature.parameters.values()
+        ),
+        signature.return_annotation,
+    )
+    hash(key)
+    return key
+
+
+def _ordered_signature_key(target: Callable[..., Any]):
+    """Return an order-sensitive structural key for *target*'s signature.
+
+    Unlike :func:`_signature_key`, keyword-only parameters keep their
+    declaration order, so the key can stand in for merge inputs whose
+    merged parameter order matters.  ``None`` is returned when the key
+    cannot be hashed.
+    """
+
+    try:
+        return _ordered_signature_key_from_cache(target)
+    except TypeError:
+        return None
+
+
 def _ensure_signature(target: Callable[..., Any] | Signature) -> Signature:
     """Return a concrete :class:`inspect.Signature` for *target*."""
 
     if isinstance(target, Signature):
         return target
-    return inspect.signature(target)
+    return _cached_signature(target)
 
 
 def _compatible_signatures(left: Signature, right: Signature) -> bool:
     """Return ``True`` when two signatures are structurally compatible."""
 
-    parameters_left = list(left.parameters.values())
-    parameters_right = list(right.parameters.values())
+    if len(left.parameters) != len(right.parameters):
+        return False
 
-    if len(parameters_left) != len(parameters_right):
+    # Normalised tuples delegate the per-parameter checks to C-level tuple
+    # comparison, which short-circuits on the first mismatch.
+    left_key = tuple(
+        (name, kind, default is not _EMPTY, annotation)
+        for name, kind, default, annotation in map(
+            _PARAMETER_FIELDS, left.parameters.values()
+        )
+    )
+    right_key = tuple(
+        (name, kind, default is not _EMPTY, annotation)
+        for name, kind, default, annotation in map(
+            _PARAMETER_FIELDS, right.parameters.values()
+        )
+    )
+    if left_key != right_key:
         return False
 
-    for parameter_left, parameter_right in zip(parameters_left, parameters_right):
-        if parameter_left.kind is not parameter_right.kind:
-            return False
-        if parameter_left.name != parameter_right.name:
-            return False
+    return left.return_annotation == right.return_annotation
 
-        has_default_left = parameter_left.default is not Parameter.empty
-        has_default_right = parameter_right.default is not Parameter.empty
-        if has_default_left != has_default_right:
-            return False
 
-        if parameter_left.annotation != parameter_right.annotation:
-            return False
+class _FrozenSignature(Signature):
+    """Merged signature with a cached hash for cheap repeated comparisons.
 
-    return left.return_annotation == right.return_annotation
+    Merged signatures are exposed via ``__signature__`` and routinely
+    compared against freshly merged results; caching the hash lets repeated
+    equality checks between frozen instances fail fast on a hash mismatch
+    instead of re-walking every parameter.
+    """
+
+    __slots__ = ("_cached_hash",)
+
+    def __hash__(self) -> int:
+        try:
+            return self._cached_hash
+        except AttributeError:
+            cached = super().__hash__()
+            self._cached_hash = cached
+            return cached
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is _FrozenSignature:
+            try:
+                if hash(self) != hash(other):
+                    return False
+            except TypeError:
+                pass
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        # Present as a plain Signature; the subclass is an implementation
+        # detail of merge caching.
+        return f"<Signature {self}>"
+
+
+def _build_frozen_signature(
+    parameters: list[Parameter], return_annotation: Any
+) -> _FrozenSignature:
+    """Construct the merged signature without redundant validation.
+
+    The bucketed merge already guarantees kind ordering and unique names,
+    so ``Signature.__init__``'s full validation pass is skipped via the
+    no-validate flag.  The one constraint the merge cannot guarantee — a
+    required positional parameter following a defaulted one — is checked
+    directly, deferring to the validating constructor for its error.
+    """
+
+    seen_default = False
+    for parameter in parameters:
+        kind = parameter.kind
+        if kind is _POS_ONLY or kind is _POS_OR_KW:
+            if parameter.default is _EMPTY:
+                if seen_default:
+                    return _FrozenSignature(
+                        parameters=parameters, return_annotation=return_annotation
+                    )
+            else:
+                seen_default = True
+        else:
+            break
+
+    try:
+        return _FrozenSignature(
+            parameters=parameters,
+            return_annotation=return_annotation,
+            __validate_parameters__=False,
+        )
+    except TypeError:  # pragma: no cover - defensive against CPython changes
+        return _FrozenSignature(
+            parameters=parameters, return_annotation=return_annotation
+        )
 
 
 def merge_signatures(
@@ -983,51 +1383,292 @@ def merge_signatures(
     if not callables:
         raise ValueError("merge_signatures requires at least one callable")
 
-    normalised_policy = _normalise_policy(policy)
+    # The policy string is resolved to a boolean once here; the merge loop
+    # and conflict helpers below only ever test the flag.
+    prefer_last = _normalise_policy(policy) == "prefer-last"
     resolver = _normalise_resolver(on_conflict)
 
+    if len(callables) == 1:
+        # A single callable can never conflict with itself, and any valid
+        # signature is already ordered by parameter kind.
+        return _ensure_signature(callables[0])
+
+    signatures = [_ensure_signature(target) for target in callables]
+    first = signatures[0]
+    if all(signature is first for signature in signatures[1:]):
+        # Merging a signature with itself cannot contribute new metadata.
+        return first
+
     buckets = _initial_parameter_buckets()
-    name_to_parameter: dict[str, Parameter] = {}
-    name_to_kind: dict[str, Any] = {}
+    # One lookup per parameter: each entry pairs the merged parameter with
+    # the bucket kind it currently lives under.
+    seen: dict[str, tuple[Parameter, Any]] = {}
+    seen_get = seen.get
 
     return_annotation = Signature.empty
 
-    for target in callables:
-        signature = _ensure_signature(target)
-
+    for signature in signatures:
         for parameter in signature.parameters.values():
-            existing = name_to_parameter.get(parameter.name)
-            if existing is None:
-                _add_parameter_to_buckets(buckets, parameter)
-                name_to_parameter[parameter.name] = parameter
-                name_to_kind[parameter.name] = parameter.kind
+            name = parameter.name
+            entry = seen_get(name)
+            if entry is None:
+                kind = parameter.kind
+                buckets[kind][name] = parameter
+                seen[name] = (parameter, kind)
                 continue
 
+            existing, previous_kind = entry
             merged = _merge_parameter_metadata(
-                parameter.name,
+                name,
                 existing,
                 parameter,
-                normalised_policy,
+                prefer_last,
                 resolver,
                 compare_defaults,
                 compare_annotations,
             )
 
-            previous_kind = name_to_kind[parameter.name]
-            if previous_kind is merged.kind:
-                buckets[previous_kind][parameter.name] = merged
+            merged_kind = merged.kind
+            if previous_kind is merged_kind:
+                buckets[previous_kind][name] = merged
             else:
-                del buckets[previous_kind][parameter.name]
-                buckets[merged.kind][parameter.name] = merged
-                name_to_kind[parameter.name] = merged.kind
+                del buckets[previous_kind][name]
+                buckets[merged_kind][name] = merged
 
-            name_to_parameter[parameter.name] = merged
+            seen[name] = (merged, merged_kind)
 
-        if signature.return_annotation is not Signature.empty:
+        if signature.return_annotation is not _EMPTY:
             return_annotation = signature.return_annotation
 
-    merged_parameters = list(_iter_bucketed_parameters(buckets))
-    return Signature(parameters=merged_parameters, return_annotation=return_annotation)
+    merged_parameters = _ordered_bucketed_parameters(buckets)
+    return _build_frozen_signature(merged_parameters, return_annotation)
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """Routing metadata precomputed for one combined callable."""
+
+    positional_only: tuple[str, ...]
+    positional_or_keyword: tuple[str, ...]
+    var_positional: str | None
+    keyword_only: tuple[str, ...]
+    var_keyword: str | None
+    accepted_keywords: frozenset[str]
+
+
+def _build_dispatch_plan(signature: Signature) -> _DispatchPlan:
+    """Categorise *signature*'s parameters by kind for call-time dispatch."""
+
+    positional_only: list[str] = []
+    positional_or_keyword: list[str] = []
+    var_positional: str | None = None
+    keyword_only: list[str] = []
+    var_keyword: str | None = None
+
+    for parameter in signature.parameters.values():
+        if parameter.kind is _POS_ONLY:
+            positional_only.append(parameter.name)
+        elif parameter.kind is _POS_OR_KW:
+            positional_or_keyword.append(parameter.name)
+        elif parameter.kind is _VAR_POS:
+            var_positional = parameter.name
+        elif parameter.kind is _KW_ONLY:
+            keyword_only.append(parameter.name)
+        elif parameter.kind is _VAR_KW:
+            var_keyword = parameter.name
+
+    return _DispatchPlan(
+        positional_only=tuple(positional_only),
+        positional_or_keyword=tuple(positional_or_keyword),
+        var_positional=var_positional,
+        keyword_only=tuple(keyword_only),
+        var_keyword=var_keyword,
+        accepted_keywords=frozenset(positional_or_keyword) | frozenset(keyword_only),
+    )
+
+
+def _compile_binder(
+    signature: Signature, name: str
+) -> Callable[..., tuple[Any, ...]] | None:
+    """Compile a function mirroring *signature* that returns its arguments.
+
+    The compiled binder performs CPython-native argument binding and default
+    application, replacing :meth:`Signature.bind` plus ``apply_defaults`` on
+    the call path.  ``None`` is returned when the signature cannot be
+    rendered as source, in which case callers fall back to ``bind``.
+    """
+
+    parameters = list(signature.parameters.values())
+    names = [parameter.name for parameter in parameters]
+    if any(
+        not parameter_name.isidentifier() or parameter_name.startswith("_signia")
+        for parameter_name in names
+    ):
+        return None
+    if not name.isidentifier():
+        name = "combined"
+
+    namespace: dict[str, Any] = {}
+    rendered: list[str] = []
+    last_positional_only = -1
+    for index, parameter in enumerate(parameters):
+        if parameter.kind is _POS_ONLY:
+            last_positional_only = index
+
+    star_pending = any(
+        parameter.kind is _KW_ONLY for parameter in parameters
+    ) and not any(
+        parameter.kind is _VAR_POS for parameter in parameters
+    )
+
+    for index, parameter in enumerate(parameters):
+        if parameter.kind is _VAR_POS:
+            rendered.append(f"*{parameter.name}")
+            continue
+        if parameter.kind is _VAR_KW:
+            rendered.append(f"**{parameter.name}")
+            continue
+
+        if parameter.kind is _KW_ONLY and star_pending:
+            rendered.append("*")
+            star_pending = False
+
+        text = parameter.name
+        if parameter.default is not _EMPTY:
+            default_name = f"_signia_default_{index}"
+            namespace[default_name] = parameter.default
+            text = f"{text}={default_name}"
+        rendered.append(text)
+
+        if index == last_positional_only:
+            rendered.append("/")
+
+    values = ", ".join(names)
+    body = f"return ({values},)" if names else "return ()"
+    source = f"def {name}({', '.join(rendered)}):\n    {body}"
+
+    try:
+        exec(compile(source, "<signia.combine>", "exec"), namespace)
+    except SyntaxError:  # pragma: no cover - defensive
+        return None
+    return namespace[name]
+
+
+def _compile_router(
+    plan: _DispatchPlan,
+) -> Callable[
+    [Mapping[str, Any], dict[str, Any]],
+    tuple[tuple[Any, ...], dict[str, Any], OrderedDict[str, Any]],
+]:
+    """Compile a straight-line router specialised to *plan*.
+
+    The compiled function splits a merged argument mapping plus extra
+    keyword values into ``(positional, keywords, arguments)`` for one
+    target, with ``arguments`` mirroring
+    :attr:`inspect.BoundArguments.arguments` in parameter order.  Unrolling
+    the per-kind routing into a fixed statement sequence removes plan
+    attribute loads and loop overhead, leaving only the branches the plan
+    actually needs; the split is validated natively by the eventual call.
+    """
+
+    lines = [
+        "def router(values, extra_kwargs):",
+        "    positional = []",
+        "    append = positional.append",
+        "    keywords = dict(extra_kwargs)",
+        "    arguments = OrderedDict()",
+        "    get = values.get",
+        "    kw_get = keywords.get",
+    ]
+
+    for name in plan.positional_only:
+        key = repr(name)
+        lines += [
+            f"    value = get({key}, _MISSING)",
+            "    if value is not _MISSING:",
+            "        append(value)",
+            f"        arguments[{key}] = value",
+        ]
+    if plan.positional_or_keyword:
+        # Once one positional-or-keyword parameter routes as a keyword, the
+        # ones after it cannot fill positional slots without re-binding the
+        # keyword's position, so they route as keywords too.
+        lines.append("    kw_mode = False")
+    for name in plan.positional_or_keyword:
+        key = repr(name)
+        lines += [
+            f"    value = kw_get({key}, _MISSING)",
+            "    if value is not _MISSING:",
+            f"        arguments[{key}] = value",
+            "        kw_mode = True",
+            "    else:",
+            f"        value = get({key}, _MISSING)",
+            "        if value is not _MISSING:",
+            "            if kw_mode:",
+            f"                keywords[{key}] = value",
+            "            else:",
+            "                append(value)",
+            f"            arguments[{key}] = value",
+        ]
+    if plan.var_positional is not None:
+        key = repr(plan.var_positional)
+        lines += [
+            f"    extras = tuple(values[{key}])",
+            "    if extras:",
+            "        positional.extend(extras)",
+            f"        arguments[{key}] = extras",
+        ]
+    for name in plan.keyword_only:
+        key = repr(name)
+        lines += [
+            f"    value = kw_get({key}, _MISSING)",
+            "    if value is _MISSING:",
+            f"        value = get({key}, _MISSING)",
+            "        if value is not _MISSING:",
+            f"            keywords[{key}] = value",
+            f"            arguments[{key}] = value",
+            "    else:",
+            f"        arguments[{key}] = value",
+        ]
+    if plan.var_keyword is not None:
+        key = repr(plan.var_keyword)
+        lines += [
+            f"    remainder = dict(values[{key}])",
+            "    remainder.update(keywords)",
+            "    keywords = remainder",
+            "    overflow = {",
+            "        name: value",
+            "        for name, value in keywords.items()",
+            "        if name not in accepted",
+            "    }",
+            "    if overflow:",
+            f"        arguments[{key}] = overflow",
+        ]
+
+    lines.append("    return tuple(positional), keywords, arguments")
+
+    namespace: dict[str, Any] = {
+        "OrderedDict": OrderedDict,
+        "accepted": plan.accepted_keywords,
+        "_MISSING": _MISSING,
+    }
+    exec(compile("\n".join(lines), "<signia.combine.router>", "exec"), namespace)
+    return namespace["router"]
+
+
+# Merged signatures for repeated combine() calls over the same functions.
+# Values keep strong references to the functions so the id-based keys stay
+# valid for the lifetime of each entry; the cache is cleared once full to
+# bound memory.
+_COMBINE_MERGE_CACHE: dict[
+    tuple[int, ...], tuple[tuple[Callable[..., Any], ...], Signature]
+] = {}
+_COMBINE_MERGE_CACHE_MAX = 256
+
+# Second-level cache keyed by the structural signature keys of the inputs,
+# so distinct function objects with identical signatures (e.g. the same
+# combine pattern repeated across class bodies) share one merged Signature.
+_COMBINE_STRUCTURAL_CACHE: dict[tuple[Any, ...], Signature] = {}
 
 
 def combine(
@@ -1091,61 +1732,108 @@ def combine(
     if not functions:
         raise ValueError("combine requires at least one callable")
 
-    merged_signature = merge_signatures(*functions)
+    signatures = [_cached_signature(function) for function in functions]
+    plans = [_build_dispatch_plan(signature) for signature in signatures]
     primary, *secondary = functions
-    signatures = [inspect.signature(function) for function in functions]
 
-    def _has_var_keyword(signature: Signature) -> bool:
-        return any(parameter.kind is Parameter.VAR_KEYWORD for parameter in signature.parameters.values())
+    # The merged signature is only needed once the wrapper is introspected
+    # or first called; deferring the merge keeps import-time decoration
+    # cheap for callables that are never exercised.
+    _merged_cell: list[Signature] = []
 
-    def _drop_unknown_kwargs(
-        signature: Signature, incoming: dict[str, Any]
-    ) -> tuple[dict[str, Any], dict[str, Any]]:
-        if not incoming:
-            return {}, {}
-        if _has_var_keyword(signature):
-            return dict(incoming), {}
+    def _merged_signature() -> Signature:
+        if _merged_cell:
+            return _merged_cell[0]
 
-        accepted = {
-            name
-            for name, parameter in signature.parameters.items()
-            if parameter.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
-        }
-        known = {name: incoming[name] for name in incoming if name in accepted}
-        leftover = {name: value for name, value in incoming.items() if name not in accepted}
-        return known, leftover
+        cache_key = tuple(map(id, functions))
+        cached = _COMBINE_MERGE_CACHE.get(cache_key)
+        if cached is not None and all(
+            cached_function is function
+            for cached_function, function in zip(cached[0], functions)
+        ):
+            merged = cached[1]
+        else:
+            # Order-sensitive keys: _signature_key's frozenset of keyword-only
+            # entries would let function sets differing only in kw-only order
+            # share a merge whose parameter order is deterministic.
+            keys = tuple(_ordered_signature_key(function) for function in functions)
+            structural_key = None if None in keys else keys
+            merged = (
+                _COMBINE_STRUCTURAL_CACHE.get(structural_key)
+                if structural_key is not None
+                else None
+            )
+            if merged is None:
+                merged = merge_signatures(*signatures)
+                if structural_key is not None:
+                    if len(_COMBINE_STRUCTURAL_CACHE) >= _COMBINE_MERGE_CACHE_MAX:
+                        _COMBINE_STRUCTURAL_CACHE.clear()
+                    _COMBINE_STRUCTURAL_CACHE[structural_key] = merged
+            if len(_COMBINE_MERGE_CACHE) >= _COMBINE_MERGE_CACHE_MAX:
+                _COMBINE_MERGE_CACHE.clear()
+            _COMBINE_MERGE_CACHE[cache_key] = (functions, merged)
+
+        _merged_cell.append(merged)
+        return merged
+
+    def _take_known_kwargs(
+        plan: _DispatchPlan, kwargs: dict[str, Any], remaining: set[str]
+    ) -> dict[str, Any]:
+        """Claim the names in *remaining* that *plan* accepts.
+
+        Leftovers are tracked as a name set against the original ``kwargs``
+        dict rather than copied into a new dict per target; matched names
+        are removed from *remaining* in place.
+        """
 
-    def _bind_arguments(signature: Signature, values: OrderedDict[str, Any], extra_kwargs: dict[str, Any]) -> inspect.BoundArguments:
-        positional: list[Any] = []
-        keywords: dict[str, Any] = dict(extra_kwargs)
+        if not remaining:
+            return {}
+        if plan.var_keyword is not None:
+            # The routers copy the known dict before touching it, so the
+            # caller's kwargs can be handed over uncopied when nothing has
+            # been claimed yet.
+            if len(remaining) == len(kwargs):
+                remaining.clear()
+                return kwargs
+            known = {name: kwargs[name] for name in kwargs if name in remaining}
+            remaining.clear()
+            return known
+
+        matched = remaining & plan.accepted_keywords
+        if not matched:
+            return {}
+        remaining -= matched
+        return {name: kwargs[name] for name in kwargs if name in matched}
+
+    def _make_caller(
+        function: Callable[..., Any], plan: _DispatchPlan
+    ) -> Callable[[tuple[Any, ...], dict[str, Any]], Any]:
+        # Targets that cannot accept keywords are called without unpacking an
+        # (always empty) keywords dict.
+        if (
+            not plan.positional_or_keyword
+            and not plan.keyword_only
+            and plan.var_keyword is None
+        ):
+            def caller(positional: tuple[Any, ...], keywords: dict[str, Any]) -> Any:
+                return function(*positional)
+        else:
+            def caller(positional: tuple[Any, ...], keywords: dict[str, Any]) -> Any:
+                return function(*positional, **keywords)
 
-        for parameter in signature.parameters.values():
-            if parameter.kind is Parameter.POSITIONAL_ONLY:
-                if parameter.name in values:
-                    positional.append(values[parameter.name])
-            elif parameter.kind is Parameter.POSITIONAL_OR_KEYWORD:
-                if parameter.name in values and parameter.name not in keywords:
-                    positional.append(values[parameter.name])
-            elif parameter.kind is Parameter.VAR_POSITIONAL:
-                positional.extend(values.get(parameter.name, ()))
-            elif parameter.kind is Parameter.KEYWORD_ONLY:
-                if parameter.name in values and parameter.name not in keywords:
-                    keywords[parameter.name] = values[parameter.name]
-            elif parameter.kind is Parameter.VAR_KEYWORD:
-                remainder = dict(values.get(parameter.name, {}))
-                remainder.update(keywords)
-                keywords = remainder
-
-        return signature.bind_partial(*positional, **keywords)
+        return caller
 
     def _set_call_vars(
-        function: Callable[..., Any], bound: inspect.BoundArguments, result: Any
+        function: Callable[..., Any],
+        positional: tuple[Any, ...],
+        keywords: dict[str, Any],
+        arguments: OrderedDict[str, Any],
+        result: Any,
     ) -> None:
-        ordered = OrderedDict(bound.arguments.items())
         vars_snapshot = CallVars(
-            args=bound.args,
-            kwargs=dict(bound.kwargs),
-            arguments=ordered,
+            args=positional,
+            kwargs=keywords,
+            arguments=arguments,
             result=result,
         )
         setattr(function, "vars", vars_snapshot)
@@ -1155,34 +1843,130 @@ def combine(
     ) -> Callable[..., Any]:
         template = custom_wrapper or primary
 
+        merged_signature = _merged_signature()
+        primary_plan = plans[0]
+        simple = (
+            custom_wrapper is None
+            and not secondary
+            and not primary_plan.positional_only
+            and primary_plan.var_positional is None
+            and not primary_plan.keyword_only
+            and primary_plan.var_keyword is None
+        )
+
+        if simple:
+            parameter_names = primary_plan.positional_or_keyword
+            default_map = {
+                parameter_name: parameter.default
+                for parameter_name, parameter in signatures[0].parameters.items()
+                if parameter.default is not _EMPTY
+            }
+
+            @wraps(template)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                result = primary(*args, **kwargs)
+
+                arguments: OrderedDict[str, Any] = OrderedDict()
+                positional = list(args)
+                keywords: dict[str, Any] = {}
+                supplied = len(args)
+                for index, name in enumerate(parameter_names):
+                    if index < supplied:
+                        arguments[name] = args[index]
+                    elif name in kwargs:
+                        value = kwargs[name]
+                        arguments[name] = value
+                        keywords[name] = value
+                    elif name in default_map:
+                        default = default_map[name]
+                        arguments[name] = default
+                        # Once a parameter has been routed to keywords, a
+                        # later default appended positionally would bind to
+                        # the wrong slot; keep the split replayable.
+                        if keywords:
+                            keywords[name] = default
+                        else:
+                            positional.append(default)
+
+                vars_snapshot = CallVars(
+                    args=tuple(positional),
+                    kwargs=keywords,
+                    arguments=arguments,
+                    result=result,
+                )
+                setattr(primary, "vars", vars_snapshot)
+                return result
+
+            wrapper.__signature__ = merged_signature
+
+            if name:
+                wrapper.__name__ = name
+                wrapper.__qualname__ = name
+            if doc is not None:
+                wrapper.__doc__ = doc
+
+            return wrapper
+
+        merged_names = tuple(merged_signature.parameters)
+        merged_plan = _build_dispatch_plan(merged_signature)
+        needs_defaults = any(
+            parameter.default is not _EMPTY
+            for parameter in merged_signature.parameters.values()
+        )
+        binder = _compile_binder(
+            merged_signature, name or getattr(primary, "__name__", "combined")
+        )
+
+        primary_router = _compile_router(primary_plan)
+        primary_caller = _make_caller(primary, primary_plan)
+        secondary_dispatch = tuple(
+            (function, plan, _compile_router(plan), _make_caller(function, plan))
+            for function, plan in zip(secondary, plans[1:])
+        )
+        merged_router = _compile_router(merged_plan)
+
         @wraps(template)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            bound_all = merged_signature.bind(*args, **kwargs)
-            bound_all.apply_defaults()
-            arguments = bound_all.arguments
-
-            remaining_kwargs = dict(kwargs)
-            known, remaining_kwargs = _drop_unknown_kwargs(signatures[0], remaining_kwargs)
-            bound_primary = _bind_arguments(signatures[0], arguments, known)
-            result = primary(*bound_primary.args, **bound_primary.kwargs)
-            _set_call_vars(primary, bound_primary, result)
-
-            for function, signature in zip(secondary, signatures[1:]):
-                known, remaining_kwargs = _drop_unknown_kwargs(signature, remaining_kwargs)
-                bound = _bind_arguments(signature, arguments, known)
-                outcome = function(*bound.args, **bound.kwargs)
-                _set_call_vars(function, bound, outcome)
-
-            if remaining_kwargs:
-                unexpected = next(iter(remaining_kwargs))
+            if binder is not None:
+                bound_all = None
+                arguments = OrderedDict(zip(merged_names, binder(*args, **kwargs)))
+            else:
+                bound_all = merged_signature.bind(*args, **kwargs)
+                if needs_defaults:
+                    bound_all.apply_defaults()
+                arguments = bound_all.arguments
+                # Match the binder's guarantee that variadic entries exist so
+                # the dispatch loops can index them without .get fallbacks.
+                if merged_plan.var_positional is not None:
+                    arguments.setdefault(merged_plan.var_positional, ())
+                if merged_plan.var_keyword is not None:
+                    arguments.setdefault(merged_plan.var_keyword, {})
+
+            remaining = set(kwargs)
+            known = _take_known_kwargs(primary_plan, kwargs, remaining)
+            positional, keywords, routed = primary_router(arguments, known)
+            result = primary_caller(positional, keywords)
+            _set_call_vars(primary, positional, keywords, routed, result)
+
+            for function, plan, router, caller in secondary_dispatch:
+                known = _take_known_kwargs(plan, kwargs, remaining)
+                positional, keywords, routed = router(arguments, known)
+                outcome = caller(positional, keywords)
+                _set_call_vars(function, positional, keywords, routed, outcome)
+
+            if remaining:
+                unexpected = next(name for name in kwargs if name in remaining)
                 function_name = name or primary.__name__
                 raise TypeError(
                     f"{function_name}() got an unexpected keyword argument '{unexpected}'"
                 )
 
             if custom_wrapper is not None:
-                call_args = bound_all.args
-                call_kwargs = dict(bound_all.kwargs)
+                if bound_all is None:
+                    call_args, call_kwargs, _ = merged_router(arguments, {})
+                else:
+                    call_args = bound_all.args
+                    call_kwargs = dict(bound_all.kwargs)
                 return custom_wrapper(*call_args, **call_kwargs)
 
             return result
@@ -1202,7 +1986,6 @@ def combine(
             self._builder = builder
             self._callable: Callable[..., Any] | None = None
             self._allow_configuration = True
-            self.__signature__ = merged_signature
             template = primary
             self.__module__ = template.__module__
             self.__name__ = name or template.__name__
@@ -1210,6 +1993,12 @@ def combine(
             self.__doc__ = doc if doc is not None else template.__doc__
             self.__annotations__ = getattr(template, "__annotations__", {}).copy()
 
+        @property
+        def __signature__(self) -> Signature:
+            # Computed on first introspection; decorating never pays for
+            # the merge unless the wrapper is inspected or called.
+            return _merged_signature()
+
         def _apply_metadata(self) -> None:
             if self._callable is None:
                 return
@@ -1231,7 +2020,7 @@ def combine(
                 self._allow_configuration
                 and len(args) == 1
                 and not kwargs
-                and inspect.isfunction(args[0])
+                and type(args[0]) is FunctionType
             ):
                 frame = inspect.currentframe()
                 if frame is not None:
@@ -1261,39 +2050,57 @@ def combine(
 def _strip_parameter_annotations(signature: Signature) -> Signature:
     """Return a signature with parameter annotations removed."""
 
-    parameters = [parameter.replace(annotation=Parameter.empty) for parameter in signature.parameters.values()]
-    return signature.replace(parameters=parameters)
+    parameters = signature.parameters.values()
+    if all(parameter.annotation is _EMPTY for parameter in parameters):
+        return signature
 
+    stripped = [
+        Parameter(parameter.name, parameter.kind, default=parameter.default)
+        for parameter in parameters
+    ]
+    return signature.replace(parameters=stripped)
 
-def _initial_parameter_buckets() -> dict[Any, OrderedDict[str, Parameter]]:
-    """Return empty parameter buckets keyed by :class:`inspect._ParameterKind`."""
 
-    return {kind: OrderedDict() for kind in _PARAMETER_KIND_ORDER}
+def _initial_parameter_buckets() -> list[dict[str, Parameter]]:
+    """Return empty per-kind parameter buckets indexed by kind value.
 
+    ``_ParameterKind`` is an ``IntEnum`` whose numeric order matches the
+    canonical kind order, so a flat list indexed by the kind replaces a
+    dict probe with a C-level sequence index.
+    """
 
-def _add_parameter_to_buckets(
-    buckets: dict[Any, OrderedDict[str, Parameter]], parameter: Parameter
-) -> None:
-    """Add *parameter* to the bucket matching its kind."""
+    return [{}, {}, {}, {}, {}]
 
-    buckets[parameter.kind][parameter.name] = parameter
 
+def _ordered_bucketed_parameters(
+    buckets: list[dict[str, Parameter]]
+) -> list[Parameter]:
+    """Return parameters from *buckets* in canonical kind order.
 
-def _iter_bucketed_parameters(
-    buckets: dict[Any, OrderedDict[str, Parameter]]
-):
-    """Yield parameters from *buckets* in canonical kind order."""
+    The unrolled list build avoids generator-frame overhead; each
+    ``.values()`` view is extended in a single C-level operation.
+    """
+
+    return [
+        *buckets[_POS_ONLY].values(),
+        *buckets[_POS_OR_KW].values(),
+        *buckets[_VAR_POS].values(),
+        *buckets[_KW_ONLY].values(),
+        *buckets[_VAR_KW].values(),
+    ]
 
-    for kind in _PARAMETER_KIND_ORDER:
-        yield from buckets[kind].values()
+
+_VALID_MERGE_POLICIES = frozenset({"prefer-first", "prefer-last"})
+_VALID_RESOLVER_STRATEGIES = frozenset(
+    {"raise", "prefer-annotated", "prefer-defaulted"}
+)
 
 
 def _normalise_policy(policy: str) -> str:
     """Validate and normalise the merge *policy* argument."""
 
-    allowed = {"prefer-first", "prefer-last"}
-    if policy not in allowed:
-        choices = ", ".join(sorted(allowed))
+    if policy not in _VALID_MERGE_POLICIES:
+        choices = ", ".join(sorted(_VALID_MERGE_POLICIES))
         raise ValueError(f"Unsupported policy '{policy}'. Choose one of: {choices}.")
     return policy
 
@@ -1307,9 +2114,8 @@ def _normalise_resolver(
         return None
     if callable(on_conflict):
         return on_conflict
-    allowed = {"raise", "prefer-annotated", "prefer-defaulted"}
-    if on_conflict not in allowed:
-        choices = ", ".join(sorted(allowed))
+    if on_conflict not in _VALID_RESOLVER_STRATEGIES:
+        choices = ", ".join(sorted(_VALID_RESOLVER_STRATEGIES))
         raise ValueError(
             f"Unsupported on_conflict strategy '{on_conflict}'. Choose one of: {choices}."
         )
@@ -1320,14 +2126,17 @@ def _merge_parameter_metadata(
     name: str,
     existing: Parameter,
     incoming: Parameter,
-    policy: str,
+    prefer_last: bool,
     resolver: str | ConflictResolver | None,
     compare_defaults: bool,
     compare_annotations: bool,
 ) -> Parameter:
     """Merge metadata for a parameter encountered multiple times."""
 
-    primary, secondary = _apply_policy(existing, incoming, policy)
+    if prefer_last:
+        primary, secondary = incoming, existing
+    else:
+        primary, secondary = existing, incoming
     conflicts = _detect_parameter_conflicts(primary, secondary, compare_defaults, compare_annotations)
 
     if conflicts:
@@ -1336,7 +2145,7 @@ def _merge_parameter_metadata(
             existing,
             incoming,
             conflicts,
-            policy,
+            prefer_last,
             resolver,
         )
         if resolved is None:
@@ -1359,24 +2168,18 @@ def _merge_parameter_metadata(
         return resolved
 
     default = primary.default
-    if default is Parameter.empty and secondary.default is not Parameter.empty:
+    if default is _EMPTY and secondary.default is not _EMPTY:
         default = secondary.default
 
     annotation = primary.annotation
-    if annotation is Parameter.empty and secondary.annotation is not Parameter.empty:
+    if annotation is _EMPTY and secondary.annotation is not _EMPTY:
         annotation = secondary.annotation
 
+    if default is primary.default and annotation is primary.annotation:
+        return primary
     return primary.replace(default=default, annotation=annotation)
 
 
-def _apply_policy(existing: Parameter, incoming: Parameter, policy: str) -> tuple[Parameter, Parameter]:
-    """Return the (primary, secondary) parameters according to *policy*."""
-
-    if policy == "prefer-last":
-        return incoming, existing
-    return existing, incoming
-
-
 def _detect_parameter_conflicts(
     primary: Parameter,
     secondary: Parameter,
@@ -1392,16 +2195,19 @@ def _detect_parameter_conflicts(
 
     if (
         compare_defaults
-        and primary.default is not Parameter.empty
-        and secondary.default is not Parameter.empty
+        and primary.default is not _EMPTY
+        and secondary.default is not _EMPTY
         and primary.default != secondary.default
     ):
         conflicts.append(("default", primary.default, secondary.default))
 
     if (
         compare_annotations
-        and primary.annotation is not Parameter.empty
-        and secondary.annotation is not Parameter.empty
+        # PEP 563 annotation strings are interned by the compiler, so the
+        # identity test settles the common equal case before str.__eq__.
+        and primary.annotation is not secondary.annotation
+        and primary.annotation is not _EMPTY
+        and secondary.annotation is not _EMPTY
         and primary.annotation != secondary.annotation
     ):
         conflicts.append(("annotation", primary.annotation, secondary.annotation))
@@ -1414,10 +2220,10 @@ def _resolve_parameter_conflict(
     existing: Parameter,
     incoming: Parameter,
     conflicts: list[ConflictDetail],
-    policy: str,
+    prefer_last: bool,
     resolver: str | ConflictResolver | None,
 ) -> tuple[Parameter | None, str]:
-    """Resolve a parameter conflict according to *resolver* and *policy*."""
+    """Resolve a parameter conflict according to *resolver* and the policy flag."""
 
     if callable(resolver):
         resolved = resolver(name, existing, incoming, tuple(conflicts))
@@ -1432,16 +2238,16 @@ def _resolve_parameter_conflict(
         return _select_parameter_candidate(
             existing,
             incoming,
-            policy,
-            lambda parameter: parameter.annotation is not Parameter.empty,
+            prefer_last,
+            lambda parameter: parameter.annotation is not _EMPTY,
         )
 
     if resolver == "prefer-defaulted":
         return _select_parameter_candidate(
             existing,
             incoming,
-            policy,
-            lambda parameter: parameter.default is not Parameter.empty,
+            prefer_last,
+            lambda parameter: parameter.default is not _EMPTY,
         )
 
     raise ValueError(f"Unknown on_conflict strategy: {resolver}")
@@ -1450,10 +2256,10 @@ def _resolve_parameter_conflict(
 def _select_parameter_candidate(
     existing: Parameter,
     incoming: Parameter,
-    policy: str,
+    prefer_last: bool,
     predicate: Callable[[Parameter], bool],
 ) -> tuple[Parameter, str]:
-    """Select a parameter based on *predicate* and *policy*."""
+    """Select a parameter based on *predicate* and the policy flag."""
 
     candidates: list[tuple[str, Parameter]] = []
     if predicate(existing):
@@ -1464,7 +2270,7 @@ def _select_parameter_candidate(
     if not candidates:
         candidates = [("existing", existing), ("incoming", incoming)]
 
-    if policy == "prefer-last":
+    if prefer_last:
         source, parameter = candidates[-1]
     else:
         source, parameter = candidates[0]
@@ -1480,23 +2286,26 @@ def _finalise_resolved_parameter(
     """Fill in missing metadata on *resolved* using *counterpart* when safe."""
 
     conflict_types = {kind for kind, _, _ in conflicts}
-    updated = resolved
 
+    default = resolved.default
     if (
         "default" not in conflict_types
-        and updated.default is Parameter.empty
-        and counterpart.default is not Parameter.empty
+        and default is _EMPTY
+        and counterpart.default is not _EMPTY
     ):
-        updated = updated.replace(default=counterpart.default)
+        default = counterpart.default
 
+    annotation = resolved.annotation
     if (
         "annotation" not in conflict_types
-        and updated.annotation is Parameter.empty
-        and counterpart.annotation is not Parameter.empty
+        and annotation is _EMPTY
+        and counterpart.annotation is not _EMPTY
     ):
-        updated = updated.replace(annotation=counterpart.annotation)
+        annotation = counterpart.annotation
 
-    return updated
+    if default is resolved.default and annotation is resolved.annotation:
+        return resolved
+    return resolved.replace(default=default, annotation=annotation)
 
 
 def _raise_parameter_conflict(name: str, conflicts: list[ConflictDetail]) -> None:
@@ -28,8 +28,15 @@ def tertiary(*, trace: dict[str, str]) -> None:
     trace.update({"used": "yes"})
 
 
-def test_combine_signature_and_routing():
-    wrapped = combine(primary, secondary, tertiary)
+@pytest.fixture(scope="session")
+def combined_pipeline():
+    """Session-scoped wrapper so repeated tests reuse one decoration."""
+
+    return combine(primary, secondary, tertiary)
+
+
+def test_combine_signature_and_routing(combined_pipeline):
+    wrapped = combined_pipeline
     signature = inspect.signature(wrapped)
     expected = merge_signatures(primary, secondary, tertiary)
 
@@ -44,6 +51,26 @@ def test_combine_signature_and_routing():
     assert trail == {"used": "yes"}
 
 
+def test_combine_keyword_override_keeps_trailing_defaults_replayable():
+    def solo(a: int, b: int = 2, c: int = 3) -> tuple[int, int, int]:
+        return a, b, c
+
+    def helper(*, z: int = 0) -> int:
+        return z
+
+    single = combine(solo)
+    assert single(1, b=5) == (1, 5, 3)
+    assert solo.vars.args == (1,)
+    assert solo.vars.kwargs == {"b": 5, "c": 3}
+    assert solo(*solo.vars.args, **solo.vars.kwargs) == (1, 5, 3)
+
+    multi = combine(solo, helper)
+    assert multi(1, b=5) == (1, 5, 3)
+    assert solo.vars.args == (1,)
+    assert solo.vars.kwargs == {"b": 5, "c": 3}
+    assert solo(*solo.vars.args, **solo.vars.kwargs) == (1, 5, 3)
+
+
 def test_combine_unexpected_keyword_raises():
     wrapped = combine(primary, secondary)
 
@@ -7,7 +7,7 @@ import inspect
 
 import pytest
 
-from signia import SigniaWarning, fuse
+from signia import SigniaWarning, chain_kw, fuse
 from signia._core import CallVars, _FusedSourceProxy
 
 
@@ -41,6 +41,21 @@ def test_proxy_overrides_bypass_cache():
     assert calls == [(4, 5), (4, 7)]
 
 
+def test_proxy_repeated_overrides_memoized():
+    calls: list[tuple[int, int]] = []
+
+    def target(x: int, *, y: int) -> int:
+        calls.append((x, y))
+        return x + y
+
+    proxy = _FusedSourceProxy(target, 4, y=5)
+
+    assert proxy(y=7) == 11
+    assert proxy(y=7) == 11
+    assert proxy(y=8) == 12
+    assert calls == [(4, 7), (4, 8)]
+
+
 def test_proxy_defaults_and_signature_snapshot():
     def sample(a: int, b: int = 2, *, c: int = 3, d: int) -> int:
         return a + b + c + d
@@ -54,6 +69,40 @@ def test_proxy_defaults_and_signature_snapshot():
     assert proxy.defaults == {"b": 2, "c": 3}
 
 
+def test_proxy_keyword_mapping_expansion():
+    def sample(a: int, *, b: int = 2) -> int:
+        return a + b
+
+    proxy = _FusedSourceProxy(sample, 1, b=5)
+
+    assert {**proxy} == {"b": 5}
+    assert list(proxy) == ["b"]
+    assert proxy["b"] == 5
+    assert bool(_FusedSourceProxy(sample, 1))
+
+
+def test_chain_kw_composes_proxy_keywords():
+    def left(*, a: int, b: int = 2) -> int:
+        return a + b
+
+    def right(*, b: int, c: int) -> int:
+        return b + c
+
+    first = _FusedSourceProxy(left, a=1)
+    second = _FusedSourceProxy(right, b=9, c=3)
+
+    chained = chain_kw(first, second)
+
+    assert dict(chained) == {"a": 1, "b": 9, "c": 3}
+    assert (lambda **kw: kw)(**chained) == {"a": 1, "b": 9, "c": 3}
+
+    with pytest.raises(TypeError):
+        chained["a"] = 99
+
+    with pytest.raises(ValueError):
+        chain_kw()
+
+
 def test_fuse_function_auto_publish():
     calls: list[tuple[str, tuple[int, ...]]] = []
     seen_types: list[type[_FusedSourceProxy]] = []
@@ -36,6 +36,7 @@ def test_mirror_signature_metadata():
     assert decorated.__doc__ == sample_function.__doc__
     assert decorated.__name__ == sample_function.__name__
     assert decorated.__wrapped__ is sample_function
+    assert decorated.__annotations__ == sample_function.__annotations__
     assert inspect.signature(decorated) == inspect.signature(sample_function)
 
 